@@ -34,22 +34,37 @@ The entry point for the command line application is the
 examples.
 """
 
-from .document import Document
-from .config import AppConfig
-from .embedding_client import EmbeddingClient
-from .vector_store import VectorStoreBuilder
-from .factory import ParserFactory
-from .git_parser import GitRepositoryHandler
-from .confluence_parser import ConfluenceSpaceHandler
-from .parsers.base_parser import DocumentParser
-
-__all__ = [
-    "Document",
-    "AppConfig",
-    "EmbeddingClient",
-    "VectorStoreBuilder",
-    "ParserFactory",
-    "GitRepositoryHandler",
-    "ConfluenceSpaceHandler",
-    "DocumentParser",
-]
\ No newline at end of file
+import importlib
+from typing import Any
+
+# Public names are resolved lazily (PEP 562) so that importing the
+# package does not drag in heavy optional dependencies (faiss, pandas,
+# gitpython, atlassian, ...) before they are actually needed.  This
+# keeps CLI startup and `--help` fast.
+_LAZY = {
+    "Document": (".document", "Document"),
+    "AppConfig": (".config", "AppConfig"),
+    "EmbeddingClient": (".embedding_client", "EmbeddingClient"),
+    "VectorStoreBuilder": (".vector_store", "VectorStoreBuilder"),
+    "ParserFactory": (".factory", "ParserFactory"),
+    "GitRepositoryHandler": (".git_parser", "GitRepositoryHandler"),
+    "ConfluenceSpaceHandler": (".confluence_parser", "ConfluenceSpaceHandler"),
+    "DocumentParser": (".parsers.base_parser", "DocumentParser"),
+}
+
+__all__ = list(_LAZY)
+
+
+def __getattr__(name: str) -> Any:
+    try:
+        module_name, attr = _LAZY[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = getattr(importlib.import_module(module_name, __name__), attr)
+    # Cache so subsequent lookups bypass __getattr__ entirely.
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list:
+    return sorted(set(globals()) | set(__all__))
\ No newline at end of file
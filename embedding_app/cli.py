@@ -15,13 +15,21 @@ import argparse
 import json
 import logging
 import os
-from typing import List
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from itertools import islice
+from typing import Any, Dict, Iterator, List, Type, TypeVar
+
+try:
+    import orjson  # type: ignore
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None  # type: ignore
 
 from .config import AppConfig, GitSettings, ConfluenceSettings, EmbeddingConfig
 from .utils import setup_logging
 from .git_parser import GitRepositoryHandler
 from .confluence_parser import ConfluenceSpaceHandler
-from .factory import ParserFactory
+from .factory import ParserFactory, parse_file
 from .embedding_client import EmbeddingClient
 from .vector_store import VectorStoreBuilder
 from .document import Document
@@ -30,6 +38,49 @@ from .utils import list_files
 
 logger = logging.getLogger(__name__)
 
+#: Extensions whose parsers are CPU-bound (PDF text extraction, Word
+#: XML processing, OCR) and therefore worth farming out to worker
+#: processes; lightweight text/tabular formats stay in-process where
+#: IPC overhead would dominate.
+_CPU_BOUND_EXTS = frozenset(
+    {".pdf", ".docx", ".doc", ".png", ".jpg", ".jpeg", ".tiff", ".bmp"}
+)
+
+#: Minimum number of CPU-bound files before a process pool is worth its
+#: startup cost.
+_MIN_FILES_FOR_POOL = 4
+
+
+def _parse_workers() -> int:
+    """Number of parser worker processes (EMBAPP_PARSE_WORKERS or CPU count)."""
+    try:
+        workers = int(os.environ.get("EMBAPP_PARSE_WORKERS", "0"))
+    except ValueError:
+        workers = 0
+    return workers if workers > 0 else (os.cpu_count() or 1)
+
+
+_SettingsT = TypeVar("_SettingsT")
+
+
+def _parse_settings(cls: Type[_SettingsT], raw: str, option: str) -> _SettingsT:
+    """Parse a JSON CLI argument into the given settings dataclass.
+
+    Uses orjson when available (keeping the latency-sensitive startup
+    path fast) and reports unknown or malformed fields with the
+    offending option name.
+    """
+    try:
+        data: Any = orjson.loads(raw) if orjson is not None else json.loads(raw)
+    except Exception as exc:
+        raise SystemExit(f"Failed to parse {option}: {exc}")
+    if not isinstance(data, dict):
+        raise SystemExit(f"Failed to parse {option}: expected a JSON object")
+    try:
+        return cls(**data)
+    except TypeError as exc:
+        raise SystemExit(f"Failed to parse {option}: {exc}")
+
 
 def parse_args(argv: List[str] | None = None) -> AppConfig:
     """Parse command line arguments into an AppConfig instance."""
@@ -78,27 +129,19 @@ def parse_args(argv: List[str] | None = None) -> AppConfig:
     # Parse optional JSON settings
     git_cfg = None
     if args.git_settings:
-        try:
-            git_dict = json.loads(args.git_settings)
-            git_cfg = GitSettings(**git_dict)
-        except Exception as exc:
-            raise SystemExit(f"Failed to parse --git_settings: {exc}")
+        git_cfg = _parse_settings(GitSettings, args.git_settings, "--git_settings")
 
     conf_cfg = None
     if args.confluence_settings:
-        try:
-            conf_dict = json.loads(args.confluence_settings)
-            conf_cfg = ConfluenceSettings(**conf_dict)
-        except Exception as exc:
-            raise SystemExit(f"Failed to parse --confluence_settings: {exc}")
+        conf_cfg = _parse_settings(
+            ConfluenceSettings, args.confluence_settings, "--confluence_settings"
+        )
 
     embed_cfg = EmbeddingConfig()
     if args.embedding_config:
-        try:
-            embed_dict = json.loads(args.embedding_config)
-            embed_cfg = EmbeddingConfig(**embed_dict)
-        except Exception as exc:
-            raise SystemExit(f"Failed to parse --embedding_config: {exc}")
+        embed_cfg = _parse_settings(
+            EmbeddingConfig, args.embedding_config, "--embedding_config"
+        )
 
     config = AppConfig(
         vector_store_path=args.vector_store_path,
@@ -115,14 +158,8 @@ def parse_args(argv: List[str] | None = None) -> AppConfig:
     return config
 
 
-def collect_documents(config: AppConfig) -> List[Document]:
-    """Collect documents from the specified sources.
-
-    At least one of files_location, git_settings or confluence_settings
-    must be provided.  Each source is processed in turn and the
-    resulting documents concatenated.
-    """
-    documents: List[Document] = []
+def _iter_source_documents(config: AppConfig) -> Iterator[Document]:
+    """Yield documents from each configured source in turn."""
     factory = ParserFactory()
     # Process files from local file system
     if config.files_location:
@@ -130,55 +167,125 @@ def collect_documents(config: AppConfig) -> List[Document]:
         if os.path.isfile(path):
             parser = factory.get_parser(path)
             if parser:
-                documents.extend(parser.parse(path))
+                yield from parser.parse(path)
             else:
                 logger.warning("Unsupported file type: %s", path)
         elif os.path.isdir(path):
+            # Group files by extension so each parser is resolved once
+            # per extension and then runs over all of its files in a
+            # tight loop, rather than re-dispatching per file.
+            groups: Dict[str, List[str]] = defaultdict(list)
             for file_path in list_files(path):
-                parser = factory.get_parser(file_path)
-                if parser:
-                    documents.extend(parser.parse(file_path))
-                else:
-                    logger.debug("Skipping unsupported file: %s", file_path)
+                dot = file_path.rfind(".")
+                ext = file_path[dot:].lower() if dot >= 0 else ""
+                groups[ext].append(file_path)
+            cpu_bound_files: List[str] = []
+            for ext, files in groups.items():
+                parse = ParserFactory.get_parse_fn(ext)
+                if parse is None:
+                    logger.debug(
+                        "Skipping %d unsupported files with extension %r",
+                        len(files),
+                        ext,
+                    )
+                    continue
+                if ext in _CPU_BOUND_EXTS:
+                    cpu_bound_files.extend(files)
+                    continue
+                for file_path in files:
+                    yield from parse(file_path)
+            # CPU-bound formats are embarrassingly parallel across
+            # files; offload them to worker processes when there are
+            # enough to amortise pool startup.
+            if len(cpu_bound_files) >= _MIN_FILES_FOR_POOL:
+                with ProcessPoolExecutor(max_workers=_parse_workers()) as executor:
+                    futures = [
+                        executor.submit(parse_file, file_path)
+                        for file_path in cpu_bound_files
+                    ]
+                    for future in as_completed(futures):
+                        yield from future.result()
+            else:
+                for file_path in cpu_bound_files:
+                    yield from parse_file(file_path)
         else:
             logger.error("files_location %s does not exist", path)
 
     # Process Git repository
     if config.git_settings:
         handler = GitRepositoryHandler(config.git_settings)
-        docs = handler.process()
-        documents.extend(docs)
+        yield from handler.process()
 
     # Process Confluence space
     if config.confluence_settings:
         handler = ConfluenceSpaceHandler(config.confluence_settings)
-        docs = handler.process()
-        documents.extend(docs)
+        yield from handler.process()
+
+
+def iter_documents(config: AppConfig) -> Iterator[Document]:
+    """Stream documents from the specified sources.
+
+    Documents are yielded as the sources produce them rather than
+    accumulated into one large list, so the pipeline can embed and
+    index a corpus far larger than available memory.  The session id,
+    when configured, is attached to each document's metadata as it
+    passes through.
+    """
+    session_id = config.session_id
+    for doc in _iter_source_documents(config):
+        if session_id:
+            doc.metadata["session_id"] = session_id
+        yield doc
+
+
+def collect_documents(config: AppConfig) -> List[Document]:
+    """Collect all documents from the specified sources into a list.
 
+    At least one of files_location, git_settings or confluence_settings
+    must be provided.  This is a convenience wrapper around
+    :func:`iter_documents` for callers that want the full corpus in
+    memory; the pipeline itself streams instead.
+    """
+    documents = list(iter_documents(config))
     if not documents:
         raise RuntimeError(
             "No documents were collected. Please provide a valid files_location, git_settings or confluence_settings."
         )
-
-    # Attach session id to each document's metadata if provided
-    if config.session_id:
-        for doc in documents:
-            doc.metadata["session_id"] = config.session_id
     return documents
 
 
 def run_pipeline(config: AppConfig) -> str:
-    """Execute the full processing pipeline and return the store name."""
-    documents = collect_documents(config)
-    # Extract texts for embedding
-    texts = [doc.text for doc in documents]
+    """Execute the full processing pipeline and return the store name.
+
+    Documents are consumed from :func:`iter_documents` in chunks: each
+    chunk is embedded and immediately added to the FAISS index, so peak
+    memory is bounded by the chunk size rather than the corpus size.
+    """
     embedding_client = EmbeddingClient(config.embedding_config)
-    logger.info("Calling embedding service for %d documents", len(texts))
-    embeddings = embedding_client.embed_documents(texts)
-    # Build vector store
     builder = VectorStoreBuilder(config.vector_store_path, config.vector_store_name)
-    store_name = builder.build(documents, embeddings)
-    return store_name
+    # Pull enough documents per chunk to keep the concurrent embedding
+    # workers busy without materialising the whole corpus.
+    chunk_size = max(
+        1,
+        config.embedding_config.batch_size * config.embedding_config.max_concurrency,
+    )
+    doc_iter = iter_documents(config)
+    total = 0
+    while True:
+        chunk = list(islice(doc_iter, chunk_size))
+        if not chunk:
+            break
+        texts = [doc.text for doc in chunk]
+        logger.info("Calling embedding service for %d documents", len(texts))
+        embeddings = embedding_client.embed_documents(texts)
+        builder.add_batch(chunk, embeddings)
+        total += len(chunk)
+    if total == 0:
+        raise RuntimeError(
+            "No documents were collected. Please provide a valid files_location, git_settings or confluence_settings."
+        )
+    logger.info("Embedded and indexed %d documents", total)
+    return builder.finalize()
 
 
 def main(argv: List[str] | None = None) -> None:
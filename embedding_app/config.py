@@ -14,7 +14,7 @@ from dataclasses import dataclass, field
 from typing import Optional, Dict, Any, List
 
 
-@dataclass
+@dataclass(slots=True)
 class GitSettings:
     """Options controlling how a Git repository is processed.
 
@@ -38,6 +38,26 @@ class GitSettings:
     branch:
         Optional branch name to checkout after cloning.  If not
         specified the repository's default branch is used.
+    full_history:
+        When ``False`` (the default) the repository is cloned shallowly
+        (``--depth=1 --filter=blob:none --single-branch``), fetching
+        only the tip commit's trees and pulling blobs lazily.  Parsing
+        only ever reads the working tree, so history is wasted
+        bandwidth, disk and memory on large repositories; set this to
+        ``True`` if full history is genuinely required.
+    fetch_lfs:
+        When ``False`` (the default) Git-LFS smudging is disabled for
+        the clone, so LFS pointer files are left in place instead of
+        downloading the large binary artifacts they reference.  The
+        parsers cannot use those binaries anyway.
+    recurse_submodules:
+        When ``False`` (the default) submodules are not cloned.  Set to
+        ``True`` to include submodule working trees.
+    skip_dirs:
+        Directory names pruned from the repository walk.  When ``None``
+        a default set of well-known junk directories is skipped
+        (``.git``, ``node_modules``, virtualenvs, build output and tool
+        caches); pass an explicit list (possibly empty) to override.
     """
 
     url: str
@@ -45,9 +65,13 @@ class GitSettings:
     include_extensions: Optional[List[str]] = None
     max_files: Optional[int] = None
     branch: Optional[str] = None
+    full_history: bool = False
+    fetch_lfs: bool = False
+    recurse_submodules: bool = False
+    skip_dirs: Optional[List[str]] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ConfluenceSettings:
     """Options for retrieving pages from a Confluence space.
 
@@ -64,6 +88,11 @@ class ConfluenceSettings:
     max_pages:
         The maximum number of pages to retrieve.  When ``None`` all
         pages are fetched.
+    max_concurrency:
+        Maximum number of page-body requests kept in flight at once.
+        Fetching bodies is dominated by network round trips, so a
+        modest amount of concurrency shortens the ingest stage
+        considerably.  Defaults to 8.
     """
 
     url: str
@@ -71,9 +100,10 @@ class ConfluenceSettings:
     token: str
     space_key: str
     max_pages: Optional[int] = None
+    max_concurrency: int = 8
 
 
-@dataclass
+@dataclass(slots=True)
 class EmbeddingConfig:
     """Configuration controlling the embedding generation process.
 
@@ -93,14 +123,28 @@ class EmbeddingConfig:
         Additional keyword arguments forwarded to the embedding
         endpoint as part of each request.  This allows callers to
         select specific models or configuration on the server side.
+    max_concurrency:
+        Maximum number of batch requests kept in flight at once.  The
+        embedding phase is latency bound, so overlapping several HTTP
+        calls reduces wall time roughly proportionally to this cap.
+        The default of 4 is gentle on local services.
+    max_tokens_per_batch:
+        Approximate token budget per request.  Documents are grouped
+        by length so each call fills the model up to this budget
+        instead of a fixed document count: many short documents pack
+        into one request while a single very long document no longer
+        drags a whole batch over the server's limit.  Tokens are
+        estimated as ``len(text) // 4``.
     """
 
     endpoint: str = "http://localhost:8001/v1/embeddings"
     batch_size: int = 32
     model_kwargs: Dict[str, Any] = field(default_factory=dict)
+    max_concurrency: int = 4
+    max_tokens_per_batch: int = 8000
 
 
-@dataclass
+@dataclass(slots=True)
 class AppConfig:
     """Top level configuration for the vector store generation application.
 
@@ -11,24 +11,42 @@ content is converted to plain text using BeautifulSoup.
 from __future__ import annotations
 
 import logging
-from typing import List
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Any, Dict, List, Optional
 
 try:
     from atlassian import Confluence  # type: ignore
 except ImportError as exc:  # pragma: no cover - optional dependency
     Confluence = None  # type: ignore
 
+try:
+    from selectolax.parser import HTMLParser  # type: ignore
+except ImportError:  # pragma: no cover - optional dependency
+    HTMLParser = None  # type: ignore
+
 try:
     from bs4 import BeautifulSoup  # type: ignore
 except ImportError:
     BeautifulSoup = None  # type: ignore
 
+# Prefer the C-based lxml parser for BeautifulSoup when available; the
+# pure-Python "html.parser" backend is an order of magnitude slower.
+try:
+    import lxml  # type: ignore # noqa: F401
+
+    _BS_PARSER = "lxml"
+except ImportError:  # pragma: no cover - optional dependency
+    _BS_PARSER = "html.parser"
+
 from .config import ConfluenceSettings
 from .document import Document
 
 
 logger = logging.getLogger(__name__)
 
+#: Number of pages requested per listing call when paginating a space.
+_PAGE_WINDOW = 100
+
 
 class ConfluenceSpaceHandler:
     """Retrieves pages from a Confluence space and converts them to documents."""
@@ -39,10 +57,10 @@ class ConfluenceSpaceHandler:
                 "The atlassian-python-api library is required to access Confluence. "
                 "Install atlassian-python-api via pip."
             )
-        if BeautifulSoup is None:
+        if HTMLParser is None and BeautifulSoup is None:
             raise RuntimeError(
-                "BeautifulSoup4 is required to parse Confluence page content. "
-                "Install bs4 via pip."
+                "selectolax or BeautifulSoup4 is required to parse Confluence "
+                "page content. Install selectolax (preferred) or bs4 via pip."
             )
         self.settings = settings
         self.client = Confluence(
@@ -52,13 +70,57 @@ class ConfluenceSpaceHandler:
         )
 
     def _html_to_text(self, html: str) -> str:
-        """Convert Confluence storage format (HTML) to plain text."""
-        soup = BeautifulSoup(html, "html.parser")
+        """Convert Confluence storage format (HTML) to plain text.
+
+        Uses selectolax when installed (a thin wrapper over the C
+        lexbor engine, 10-30x faster than pure-Python parsing and
+        GIL-releasing, so it composes with the concurrent page
+        fetches); otherwise falls back to BeautifulSoup with the lxml
+        backend where available.
+        """
+        if HTMLParser is not None:
+            tree = HTMLParser(html)
+            node = tree.body if tree.body is not None else tree.root
+            if node is not None:
+                return node.text(separator="\n", strip=True)
+            return ""
+        soup = BeautifulSoup(html, _BS_PARSER)
         return soup.get_text(separator="\n", strip=True)
 
+    def _fetch_page(self, page: Dict[str, Any]) -> Optional[Document]:
+        """Fetch and convert a single page, returning ``None`` on failure.
+
+        Failures are logged rather than raised so that one broken page
+        does not abort the rest of the ingest.
+        """
+        page_id = page.get("id")
+        title = page.get("title", "")
+        try:
+            page_data = self.client.get_page_by_id(page_id, expand="body.storage")
+            storage = page_data.get("body", {}).get("storage", {}).get("value", "")
+            text = self._html_to_text(storage)
+            metadata = {
+                "page_id": page_id,
+                "title": title,
+                "space_key": self.settings.space_key,
+                "url": f"{self.settings.url}/pages/{page_id}",
+            }
+            return Document(text=text, metadata=metadata)
+        except Exception:
+            logger.exception(
+                "ConfluenceSpaceHandler: failed to fetch or parse page %s (%s)",
+                page_id,
+                title,
+            )
+            return None
+
     def process(self) -> List[Document]:
         """Fetch pages from the configured space and return documents.
 
+        Page bodies are retrieved concurrently with a bounded thread
+        pool (``settings.max_concurrency`` workers) since each fetch is
+        a blocking network round trip.
+
         Returns
         -------
         list of Document
@@ -66,48 +128,52 @@ class ConfluenceSpaceHandler:
             represented by a single document.  If a page fails to
             fetch or parse it is logged and skipped.
         """
-        max_pages = self.settings.max_pages or float("inf")
+        max_pages = self.settings.max_pages
+        space_key = self.settings.space_key
         logger.info(
             "Fetching up to %s pages from Confluence space %s",
-            max_pages if max_pages != float("inf") else "all",
-            self.settings.space_key,
+            max_pages if max_pages is not None else "all",
+            space_key,
         )
         documents: List[Document] = []
-        try:
-            # Use the built in method to get page ids and titles.  We set limit
-            # to a high value because we handle max_pages ourselves.
-            pages = self.client.get_all_pages_from_space(
-                space=self.settings.space_key, start=0, limit=max_pages, status="current"
-            )
-        except Exception:
-            logger.exception(
-                "ConfluenceSpaceHandler: failed to list pages for space %s",
-                self.settings.space_key,
-            )
-            return documents
-        count = 0
-        for page in pages:
-            if count >= max_pages:
-                break
-            page_id = page.get("id")
-            title = page.get("title", "")
+        # List page ids and titles in fixed-size windows; the API wants
+        # an integer limit, so paginate with start offsets rather than
+        # passing a sentinel and re-checking a bound per page.
+        pages: List[Dict[str, Any]] = []
+        start = 0
+        while True:
+            limit = _PAGE_WINDOW
+            if max_pages is not None:
+                remaining = max_pages - len(pages)
+                if remaining <= 0:
+                    break
+                limit = min(limit, remaining)
             try:
-                page_data = self.client.get_page_by_id(page_id, expand="body.storage")
-                storage = page_data.get("body", {}).get("storage", {}).get("value", "")
-                text = self._html_to_text(storage)
-                metadata = {
-                    "page_id": page_id,
-                    "title": title,
-                    "space_key": self.settings.space_key,
-                    "url": f"{self.settings.url}/pages/{page_id}",
-                }
-                documents.append(Document(text=text, metadata=metadata))
-                count += 1
+                window = self.client.get_all_pages_from_space(
+                    space=space_key, start=start, limit=limit, status="current"
+                )
             except Exception:
                 logger.exception(
-                    "ConfluenceSpaceHandler: failed to fetch or parse page %s (%s)",
-                    page_id,
-                    title,
+                    "ConfluenceSpaceHandler: failed to list pages for space %s",
+                    space_key,
                 )
-        logger.info("Fetched %d pages from Confluence space %s", count, self.settings.space_key)
+                break
+            if not window:
+                break
+            pages.extend(window)
+            if len(window) < limit:
+                break
+            start += len(window)
+        max_workers = max(1, min(self.settings.max_concurrency, len(pages) or 1))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = [executor.submit(self._fetch_page, page) for page in pages]
+            for future in as_completed(futures):
+                document = future.result()
+                if document is not None:
+                    documents.append(document)
+        logger.info(
+            "Fetched %d pages from Confluence space %s",
+            len(documents),
+            space_key,
+        )
         return documents
\ No newline at end of file
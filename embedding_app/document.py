@@ -14,7 +14,7 @@ from dataclasses import dataclass, field
 from typing import Dict, Any
 
 
-@dataclass
+@dataclass(slots=True)
 class Document:
     """Represents a unit of text along with associated metadata.
 
@@ -44,5 +44,10 @@ class Document:
         if not isinstance(self.text, str):
             raise TypeError(f"Document.text must be a string, got {type(self.text)!r}")
 
-        # Normalise metadata keys to strings to avoid serialisation issues
-        self.metadata = {str(k): v for k, v in self.metadata.items()}
\ No newline at end of file
+        # Normalise metadata keys to strings to avoid serialisation
+        # issues.  Keys are almost always strings already, so only
+        # rebuild the dict when a non-string key is actually present;
+        # the any() generator avoids allocating anything on the common
+        # fast path.
+        if any(not isinstance(k, str) for k in self.metadata):
+            self.metadata = {str(k): v for k, v in self.metadata.items()}
\ No newline at end of file
@@ -10,9 +10,9 @@ simple mapping from file extensions to parser classes.
 from __future__ import annotations
 
 import logging
-from pathlib import Path
-from typing import Dict, Type, Optional
+from typing import Callable, Dict, List, Type, Optional
 
+from .document import Document
 from .parsers import DocumentParser, TextParser, CSVParser, ExcelParser, PDFParser, WordParser, ImageParser
 
 
@@ -22,6 +22,17 @@ logger = logging.getLogger(__name__)
 class ParserFactory:
     """Factory for retrieving document parsers by file extension."""
 
+    # Cache of shared parser instances, one per concrete class.  Parsers
+    # are stateless across parse() calls (see DocumentParser), so a
+    # single instance can serve every file of a given type instead of
+    # paying one allocation per file on large ingests.
+    _instances: Dict[Type[DocumentParser], DocumentParser] = {}
+
+    # Cache of extension -> bound parse method of the shared instance,
+    # collapsing class lookup, instantiation and method dispatch into a
+    # single dict hit on the per-file hot path.
+    _parse_fns: Dict[str, Callable[[str], List[Document]]] = {}
+
     # Mapping of lower‑case extension to parser class
     _parsers: Dict[str, Type[DocumentParser]] = {
         ".txt": TextParser,
@@ -53,13 +64,53 @@ class ParserFactory:
         Returns
         -------
         DocumentParser or None
-            A new parser instance if the extension is supported,
+            A shared parser instance if the extension is supported,
             otherwise ``None``.  Unsupported file types are silently
             ignored; the caller should log this if necessary.
         """
-        ext = Path(file_path).suffix.lower()
+        # Extract the extension with a plain string scan rather than
+        # constructing a PurePath per call; this lookup runs once per
+        # file in directory walks.
+        dot = file_path.rfind(".")
+        ext = file_path[dot:].lower() if dot >= 0 else ""
         parser_cls = cls._parsers.get(ext)
         if parser_cls is None:
             logger.debug("ParserFactory: no parser registered for extension %s", ext)
             return None
-        return parser_cls()
+        # setdefault keeps this safe under CPython even when callers
+        # dispatch from multiple threads; at worst two equivalent
+        # instances race and one wins.
+        return cls._instances.setdefault(parser_cls, parser_cls())
+
+    @classmethod
+    def get_parse_fn(cls, ext: str) -> Optional[Callable[[str], List[Document]]]:
+        """Return the bound ``parse`` method for a file extension.
+
+        This skips the instance lookup that :meth:`get_parser` plus an
+        attribute fetch would cost on every file: callers that already
+        know the (lower-case, dot-prefixed) extension get a directly
+        callable ``parse`` in one dict hit.  Returns ``None`` for
+        unsupported extensions.
+        """
+        fn = cls._parse_fns.get(ext)
+        if fn is not None:
+            return fn
+        parser_cls = cls._parsers.get(ext)
+        if parser_cls is None:
+            return None
+        parser = cls._instances.setdefault(parser_cls, parser_cls())
+        return cls._parse_fns.setdefault(ext, parser.parse)
+
+
+def parse_file(file_path: str) -> List[Document]:
+    """Parse a single file via the factory, returning its documents.
+
+    Unsupported extensions yield an empty list.  Defined at module
+    level so it can be pickled into ``ProcessPoolExecutor`` workers,
+    which re-create their own parser instances cheaply instead of
+    shipping parser state across process boundaries.
+    """
+    parser = ParserFactory.get_parser(file_path)
+    if parser is None:
+        return []
+    return parser.parse(file_path)
@@ -15,26 +15,88 @@ exclude lists are provided the exclude list takes precedence.
 
 from __future__ import annotations
 
+import hashlib
 import logging
 import os
 import shutil
 import tempfile
+import threading
+from concurrent.futures import Future, ProcessPoolExecutor, as_completed
 from pathlib import Path
-from typing import Iterable, List
+from typing import Callable, Dict, Iterable, List, Optional, Set, Tuple
 
 try:
     import git  # type: ignore
 except ImportError as exc:  # pragma: no cover - optional dependency
     git = None  # type: ignore
 
+try:
+    import blake3  # type: ignore
+except ImportError:  # pragma: no cover - optional dependency
+    blake3 = None  # type: ignore
+
 from .config import GitSettings
-from .factory import ParserFactory
+from .factory import ParserFactory, parse_file
 from .document import Document
 from .parsers.base_parser import DocumentParser
+from .parsers.image_parser import ImageParser
 
 
 logger = logging.getLogger(__name__)
 
+#: Minimum number of files before a process pool is worth its startup
+#: cost; smaller repositories are parsed serially.
+_MIN_FILES_FOR_POOL = 4
+
+#: Seconds between working-tree sweeps while the clone is in flight.
+_CLONE_POLL_INTERVAL = 0.25
+
+#: Directory names pruned from the walk by default: version-control
+#: internals, dependency trees, virtualenvs, build output and tool
+#: caches.  The extension filter would reject their files one by one,
+#: but only after paying the readdir/stat cost for every entry.
+_SKIP_DIRS = frozenset(
+    {
+        ".git",
+        "node_modules",
+        ".venv",
+        "venv",
+        "__pycache__",
+        ".tox",
+        "dist",
+        "build",
+        ".mypy_cache",
+    }
+)
+
+#: Files smaller than this are cheaper to reparse than to hash.
+_HASH_MIN_SIZE = 4096
+
+#: Read size for content hashing.
+_HASH_CHUNK_SIZE = 1 << 20
+
+
+def _content_digest(file_path: str) -> Optional[bytes]:
+    """Content digest of a file, or ``None`` if tiny or unreadable.
+
+    Uses BLAKE3 when available (hashes at several GB/s) and falls back
+    to SHA-256.  Tiny files are skipped because reparsing them costs
+    less than opening and hashing them.
+    """
+    try:
+        if os.path.getsize(file_path) < _HASH_MIN_SIZE:
+            return None
+        hasher = blake3.blake3() if blake3 is not None else hashlib.sha256()
+        with open(file_path, "rb") as fh:
+            while True:
+                chunk = fh.read(_HASH_CHUNK_SIZE)
+                if not chunk:
+                    break
+                hasher.update(chunk)
+        return hasher.digest()
+    except OSError:
+        return None
+
 
 class GitRepositoryHandler:
     """Clones a Git repository and yields documents using the parser factory."""
@@ -51,6 +113,17 @@ class GitRepositoryHandler:
     def clone_repository(self) -> Path:
         """Clone the configured repository into a temporary directory.
 
+        Unless ``settings.full_history`` is set, the clone is shallow
+        and partial (``--depth=1 --filter=blob:none --single-branch``):
+        the parsers only ever read the working tree, so skipping
+        history avoids an order of magnitude of network, disk and
+        memory on large repositories.  When a branch is configured it
+        is selected at clone time rather than checked out afterwards.
+        Git-LFS smudging and submodule recursion are disabled unless
+        explicitly requested via ``settings.fetch_lfs`` and
+        ``settings.recurse_submodules``: both pull large artifacts the
+        parsers cannot use.
+
         Returns
         -------
         Path
@@ -58,15 +131,36 @@ class GitRepositoryHandler:
         """
         self._temp_dir = tempfile.TemporaryDirectory(prefix="repo_clone_")
         clone_path = Path(self._temp_dir.name)
+        self._clone_into(clone_path)
+        return clone_path
+
+    def _clone_into(self, clone_path: Path) -> None:
+        """Run the actual ``git clone`` into ``clone_path``."""
         logger.info("Cloning repository %s into %s", self.settings.url, clone_path)
+        multi_options: List[str] = []
+        if not self.settings.full_history:
+            multi_options += ["--depth=1", "--filter=blob:none", "--single-branch"]
+        if self.settings.recurse_submodules:
+            multi_options.append("--recurse-submodules")
+        else:
+            multi_options.append("--no-recurse-submodules")
+        if self.settings.branch:
+            multi_options.append(f"--branch={self.settings.branch}")
+        # GIT_TERMINAL_PROMPT=0 makes auth failures fail fast instead of
+        # hanging on a credential prompt in this non-interactive context.
+        env = {"GIT_TERMINAL_PROMPT": "0"}
+        if not self.settings.fetch_lfs:
+            env["GIT_LFS_SKIP_SMUDGE"] = "1"
         try:
-            repo = git.Repo.clone_from(self.settings.url, clone_path)
-            if self.settings.branch:
-                repo.git.checkout(self.settings.branch)
+            git.Repo.clone_from(
+                self.settings.url,
+                clone_path,
+                multi_options=multi_options or None,
+                env=env,
+            )
         except Exception:
             logger.exception("Failed to clone repository %s", self.settings.url)
             raise
-        return clone_path
 
     def iter_files(self, repo_path: Path) -> Iterable[str]:
         """Iterate over files in the repository respecting extension filters.
@@ -75,52 +169,229 @@ class GitRepositoryHandler:
         which file extensions are considered.  Exclude filters take
         precedence over include filters.  The iteration stops when
         ``max_files`` files have been yielded (if specified).
+
+        The traversal uses an explicit ``os.scandir`` stack instead of
+        ``os.walk``: ``DirEntry`` objects carry cached type information
+        so no extra ``stat`` is needed per entry, paths come straight
+        from ``entry.path`` without string joins, and well-known junk
+        directories (``.git`` pack files, ``node_modules``, build
+        output — see ``GitSettings.skip_dirs``) are pruned before they
+        are ever read.
         """
+        # frozensets give O(1) membership checks in the per-file filter
+        # below, and caching max_files skips an attribute chain per file.
+        # The sets hold lowercase bytes: comparing fsencode'd names
+        # avoids a str.lower() allocation per entry, and bytes.lower()
+        # is a plain ASCII table lookup — repo filenames are almost
+        # always ASCII anyway.
         include_exts = (
-            [ext.lower() for ext in self.settings.include_extensions]
+            frozenset(ext.lower().encode() for ext in self.settings.include_extensions)
             if self.settings.include_extensions
             else None
         )
         exclude_exts = (
-            [ext.lower() for ext in self.settings.exclude_extensions]
+            frozenset(ext.lower().encode() for ext in self.settings.exclude_extensions)
             if self.settings.exclude_extensions
             else None
         )
+        skip_dirs = (
+            frozenset(self.settings.skip_dirs)
+            if self.settings.skip_dirs is not None
+            else _SKIP_DIRS
+        )
+        max_files = self.settings.max_files
+        # Checked once per traversal, not per file: even a disabled
+        # logger.debug pays attribute lookups and argument packing.
+        debug_enabled = logger.isEnabledFor(logging.DEBUG)
         count = 0
-        for root, _, files in os.walk(repo_path):
-            for filename in files:
-                ext = Path(filename).suffix.lower()
-                # Apply filters
-                if exclude_exts and ext in exclude_exts:
+        stack = [str(repo_path)]
+        while stack:
+            try:
+                it = os.scandir(stack.pop())
+            except OSError:
+                if debug_enabled:
+                    logger.debug("iter_files: cannot scan directory", exc_info=True)
+                continue
+            with it:
+                for entry in it:
+                    if entry.is_dir(follow_symlinks=False):
+                        if entry.name not in skip_dirs:
+                            stack.append(entry.path)
+                        continue
+                    name_b = os.fsencode(entry.name)
+                    dot = name_b.rfind(b".")
+                    ext_b = name_b[dot:].lower() if dot >= 0 else b""
+                    # Apply filters
+                    if exclude_exts and ext_b in exclude_exts:
+                        continue
+                    if include_exts and ext_b not in include_exts:
+                        continue
+                    yield entry.path
+                    count += 1
+                    if max_files and count >= max_files:
+                        return
+
+    def _sweep_tree(
+        self,
+        repo_path: Path,
+        submitted: Set[str],
+        pending: Dict[str, Tuple[int, int]],
+        dispatch: Callable[[str, str], None],
+        require_stable: bool,
+    ) -> None:
+        """Walk the working tree once and dispatch new files.
+
+        While the clone is still writing, a file may be yielded mid-
+        checkout; with ``require_stable`` a file is only dispatched once
+        its size and mtime are unchanged since the previous sweep.  The
+        final sweep after the clone joins runs without the stability
+        requirement and is authoritative.
+
+        ``max_files`` is enforced against ``submitted`` here because
+        :meth:`iter_files` only caps a single traversal, and sweeps may
+        see different subsets of a still-growing tree.
+        """
+        max_files = self.settings.max_files
+        for file_path in self.iter_files(repo_path):
+            if max_files and len(submitted) >= max_files:
+                return
+            if file_path in submitted:
+                continue
+            if require_stable:
+                try:
+                    st = os.stat(file_path)
+                except OSError:
                     continue
-                if include_exts and ext not in include_exts:
+                signature = (st.st_size, st.st_mtime_ns)
+                if pending.get(file_path) != signature:
+                    pending[file_path] = signature
                     continue
-                yield str(Path(root) / filename)
-                count += 1
-                if self.settings.max_files and count >= self.settings.max_files:
-                    return
+            submitted.add(file_path)
+            dot = file_path.rfind(".")
+            ext = file_path[dot:].lower() if dot >= 0 else ""
+            dispatch(file_path, ext)
 
     def process(self) -> List[Document]:
         """Clone the repository and parse eligible files into documents.
 
+        The clone is network/IO-bound while parsing is CPU-bound, so
+        the two are overlapped: the clone runs in a background thread
+        and the working tree is swept periodically, dispatching files
+        to a process pool as soon as they are fully materialised (size
+        and mtime stable across two sweeps).  A final sweep after the
+        clone completes picks up anything missed, so total wall time
+        approaches max(clone, parse) rather than their sum.
+        Repositories with only a handful of files are parsed serially
+        to avoid pool startup cost.
+
         Returns
         -------
         list of Document
             All documents parsed from the repository according to the
             configured filters.
         """
-        repo_path = self.clone_repository()
+        self._temp_dir = tempfile.TemporaryDirectory(prefix="repo_clone_")
+        repo_path = Path(self._temp_dir.name)
+        clone_error: List[BaseException] = []
+
+        def _clone() -> None:
+            try:
+                self._clone_into(repo_path)
+            except BaseException as exc:
+                clone_error.append(exc)
+
+        clone_thread = threading.Thread(target=_clone, name="git-clone")
+        clone_thread.start()
+
         documents: List[Document] = []
-        factory = ParserFactory()
-        for file_path in self.iter_files(repo_path):
-            parser = factory.get_parser(file_path)
-            if parser is None:
-                logger.debug("GitRepositoryHandler: skipping unsupported file %s", file_path)
-                continue
-            docs = parser.parse(file_path)
-            documents.extend(docs)
-        # Clean up temporary directory after processing
-        self.cleanup()
+        image_paths: List[str] = []
+        backlog: List[Tuple[str, str]] = []
+        futures: Dict[Future, str] = {}
+        executor: Optional[ProcessPoolExecutor] = None
+        submitted: Set[str] = set()
+        pending: Dict[str, Tuple[int, int]] = {}
+        # Content-addressed dedupe: vendored copies of the same blob
+        # (licenses, generated docs) are parsed once and re-emitted for
+        # every duplicate path instead of reparsed.
+        seen_digests: Dict[bytes, str] = {}
+        duplicates: List[Tuple[str, str]] = []
+        results_by_path: Dict[str, List[Document]] = {}
+
+        def _dispatch(file_path: str, ext: str) -> None:
+            nonlocal executor
+            # Images are held back and OCRed together through one
+            # Tesseract invocation after the clone finishes.
+            if ext in ImageParser._supported_exts:
+                image_paths.append(file_path)
+                return
+            digest = _content_digest(file_path)
+            if digest is not None:
+                original = seen_digests.setdefault(digest, file_path)
+                if original != file_path:
+                    duplicates.append((file_path, original))
+                    return
+            if executor is not None:
+                futures[executor.submit(parse_file, file_path)] = file_path
+                return
+            backlog.append((file_path, ext))
+            if len(backlog) >= _MIN_FILES_FOR_POOL:
+                executor = ProcessPoolExecutor(max_workers=os.cpu_count())
+                for queued_path, _ in backlog:
+                    futures[executor.submit(parse_file, queued_path)] = queued_path
+                backlog.clear()
+
+        try:
+            while clone_thread.is_alive():
+                self._sweep_tree(
+                    repo_path, submitted, pending, _dispatch, require_stable=True
+                )
+                clone_thread.join(timeout=_CLONE_POLL_INTERVAL)
+            if clone_error:
+                raise clone_error[0]
+            # Authoritative sweep over the fully checked-out tree.
+            self._sweep_tree(
+                repo_path, submitted, pending, _dispatch, require_stable=False
+            )
+            if image_paths:
+                parser = ParserFactory.get_parser(image_paths[0])
+                if isinstance(parser, ImageParser):
+                    documents.extend(parser.parse_many(image_paths))
+            # The extension was already computed during dispatch; reuse
+            # it so serial dispatch is one cached-callable lookup rather
+            # than a fresh suffix parse per file.
+            debug_enabled = logger.isEnabledFor(logging.DEBUG)
+            for file_path, ext in backlog:
+                parse = ParserFactory.get_parse_fn(ext)
+                if parse is None:
+                    if debug_enabled:
+                        logger.debug(
+                            "GitRepositoryHandler: skipping unsupported file %s",
+                            file_path,
+                        )
+                    continue
+                docs = parse(file_path)
+                results_by_path[file_path] = docs
+                documents.extend(docs)
+            if executor is not None:
+                for future in as_completed(futures):
+                    docs = future.result()
+                    results_by_path[futures[future]] = docs
+                    documents.extend(docs)
+            # Re-emit documents for duplicate blobs with their own path.
+            for dup_path, original_path in duplicates:
+                for doc in results_by_path.get(original_path, ()):
+                    metadata = dict(doc.metadata)
+                    metadata["file_path"] = dup_path
+                    documents.append(Document(text=doc.text, metadata=metadata))
+            if duplicates and debug_enabled:
+                logger.debug(
+                    "GitRepositoryHandler: skipped reparsing %d duplicate files",
+                    len(duplicates),
+                )
+        finally:
+            if executor is not None:
+                executor.shutdown()
+            self.cleanup()
         return documents
 
     def cleanup(self) -> None:
@@ -11,14 +11,25 @@ informative error and returns no documents rather than raising.
 from __future__ import annotations
 
 import logging
+import zipfile
 from pathlib import Path
-from typing import List
+from typing import List, Optional
+
+try:
+    from lxml import etree  # type: ignore
+except ImportError:  # pragma: no cover - optional dependency
+    etree = None  # type: ignore
 
 try:
     import docx  # type: ignore
 except ImportError as exc:  # pragma: no cover - optional dependency
     docx = None  # type: ignore
 
+try:
+    import olefile  # type: ignore
+except ImportError:  # pragma: no cover - optional dependency
+    olefile = None  # type: ignore
+
 try:
     import textract  # type: ignore
 except ImportError as exc:  # pragma: no cover - optional dependency
@@ -30,6 +41,9 @@ from ..document import Document
 
 logger = logging.getLogger(__name__)
 
+#: WordprocessingML namespace used by the lxml fast path.
+_W_NS = {"w": "http://schemas.openxmlformats.org/wordprocessingml/2006/main"}
+
 
 class WordParser(DocumentParser):
     """Concrete parser for Word documents."""
@@ -51,23 +65,95 @@ class WordParser(DocumentParser):
         return self._parse_docx(path, documents)
 
     def _parse_doc(self, path: Path, documents: List[Document]) -> List[Document]:
-        if textract is None:
+        # Prefer reading the CFB container in-process via olefile:
+        # textract shells out to antiword/catdoc per file, paying a
+        # fork+exec and a bytes round-trip for each document.  The
+        # olefile path drops some formatting fidelity but matches this
+        # parser's best-effort concatenation contract.
+        content: Optional[str] = None
+        if olefile is not None:
+            content = self._read_doc_via_olefile(path)
+        if content is None and textract is not None:
+            try:
+                text_bytes = textract.process(str(path))
+                content = text_bytes.decode("utf-8", errors="ignore")
+            except Exception:
+                logger.exception("WordParser: failed to extract text from .doc file %s", path)
+                return documents
+        if content is None:
             logger.error(
-                "WordParser: textract library is not installed. Please install textract to parse .doc files."
+                "WordParser: neither olefile nor textract could extract %s. "
+                "Install olefile (preferred) or textract to parse .doc files.",
+                path,
             )
             return documents
-        try:
-            text_bytes = textract.process(str(path))
-            content = text_bytes.decode("utf-8", errors="ignore")
-        except Exception:
-            logger.exception("WordParser: failed to extract text from .doc file %s", path)
-            return documents
         metadata = {"file_path": str(path), "format": "doc"}
         documents.append(Document(text=content, metadata=metadata))
         logger.debug("WordParser: parsed legacy .doc %s", path)
         return documents
 
+    def _read_doc_via_olefile(self, path: Path) -> Optional[str]:
+        """Best-effort text extraction from a legacy .doc, or None.
+
+        Reads the ``WordDocument`` stream out of the OLE compound file
+        and decodes it as CP1252, mapping Word's carriage-return
+        paragraph marks to newlines and dropping the remaining control
+        bytes.
+        """
+        try:
+            ole = olefile.OleFileIO(str(path))
+            try:
+                if not ole.exists("WordDocument"):
+                    return None
+                raw = ole.openstream("WordDocument").read()
+            finally:
+                ole.close()
+        except Exception:
+            logger.exception("WordParser: olefile could not read %s", path)
+            return None
+        decoded = raw.decode("cp1252", errors="ignore")
+        chars: List[str] = []
+        for ch in decoded:
+            if ch == "\r":
+                chars.append("\n")
+            elif ch == "\t" or ch >= " ":
+                chars.append(ch)
+        text = "".join(chars)
+        return text if text.strip() else None
+
     def _parse_docx(self, path: Path, documents: List[Document]) -> List[Document]:
+        # Fast path: read word/document.xml straight out of the zip and
+        # pull all w:t text nodes with one XPath, skipping the
+        # Paragraph/Table/Row/Cell object graph python-docx would build
+        # around every element.  python-docx remains the fallback for
+        # fidelity edge cases (and when lxml is not installed).
+        if etree is not None:
+            content = self._extract_docx_text_lxml(path)
+            if content is not None:
+                metadata = {"file_path": str(path), "format": "docx"}
+                documents.append(Document(text=content, metadata=metadata))
+                logger.debug("WordParser: parsed .docx file %s via lxml", path)
+                return documents
+        return self._parse_docx_via_python_docx(path, documents)
+
+    def _extract_docx_text_lxml(self, path: Path) -> Optional[str]:
+        """Extract all text nodes from a .docx via lxml, or None on failure."""
+        try:
+            with zipfile.ZipFile(path) as archive:
+                xml = archive.read("word/document.xml")
+            root = etree.fromstring(xml)
+            nodes = root.xpath("//w:t", namespaces=_W_NS)
+            return "\n".join(node.text for node in nodes if node.text)
+        except Exception:
+            logger.exception(
+                "WordParser: lxml fast path failed for %s; falling back to python-docx",
+                path,
+            )
+            return None
+
+    def _parse_docx_via_python_docx(
+        self, path: Path, documents: List[Document]
+    ) -> List[Document]:
         if docx is None:
             logger.error(
                 "WordParser: python-docx library is not installed. Please install python-docx to parse .docx files."
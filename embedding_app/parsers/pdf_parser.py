@@ -1,17 +1,26 @@
 """Parser for PDF documents.
 
-This parser uses the PyPDF2 library to extract text from each page
-of a PDF.  Each page becomes a separate document with the page
-number recorded in metadata.  If the PDF cannot be read the
-parser logs the error and returns an empty list.
+This parser prefers pypdfium2 — a thin wrapper over the PDFium C++
+library — which extracts page text natively and is typically 5–20×
+faster than PyPDF2's pure-Python text state machine.  When pypdfium2
+is not installed the parser falls back to PyPDF2.  Each page becomes
+a separate document with the page number recorded in metadata.  If
+the PDF cannot be read the parser logs the error and returns an
+empty list.
 """
 
 from __future__ import annotations
 
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import List
 
+try:
+    import pypdfium2 as pdfium  # type: ignore
+except ImportError:  # pragma: no cover - optional dependency
+    pdfium = None  # type: ignore
+
 try:
     import PyPDF2
 except ImportError as exc:  # pragma: no cover - import optional
@@ -24,34 +33,95 @@ from ..document import Document
 logger = logging.getLogger(__name__)
 
 
+def _safe_extract(page) -> str:
+    """Extract text from a PyPDF2 page, returning "" on failure.
+
+    Module-level so the thread-pool map in the PyPDF2 fallback stays a
+    plain function reference; failures are logged per page and never
+    abort the rest of the document.
+    """
+    try:
+        return page.extract_text() or ""
+    except Exception:
+        logger.exception("PDFParser: failed to extract text from a page")
+        return ""
+
+
 class PDFParser(DocumentParser):
     """Concrete parser for Portable Document Format (PDF) files."""
 
     def parse(self, file_path: str) -> List[Document]:
         documents: List[Document] = []
-        if PyPDF2 is None:
-            logger.error(
-                "PDFParser: PyPDF2 library is not installed. Please install PyPDF2 to parse PDFs."
-            )
-            return documents
         path = Path(file_path)
         if not path.is_file():
             logger.error("PDFParser: %s is not a file", file_path)
             return documents
+        if pdfium is not None:
+            return self._parse_with_pdfium(path, documents)
+        if PyPDF2 is not None:
+            return self._parse_with_pypdf2(path, documents)
+        logger.error(
+            "PDFParser: neither pypdfium2 nor PyPDF2 is installed. "
+            "Please install pypdfium2 (preferred) or PyPDF2 to parse PDFs."
+        )
+        return documents
+
+    def _parse_with_pdfium(self, path: Path, documents: List[Document]) -> List[Document]:
+        """Extract page texts via PDFium (native, fast path)."""
+        try:
+            pdf = pdfium.PdfDocument(str(path))
+        except Exception:
+            logger.exception("PDFParser: failed to read PDF %s", path)
+            return documents
+        try:
+            num_pages = len(pdf)
+            for idx in range(num_pages):
+                try:
+                    page = pdf[idx]
+                    textpage = page.get_textpage()
+                    text = textpage.get_text_range() or ""
+                    textpage.close()
+                    page.close()
+                except Exception:
+                    logger.exception(
+                        "PDFParser: failed to extract text from page %d of %s",
+                        idx,
+                        path,
+                    )
+                    text = ""
+                metadata = {
+                    "file_path": str(path),
+                    "page_number": idx + 1,
+                    "num_pages": num_pages,
+                }
+                documents.append(Document(text=text, metadata=metadata))
+        finally:
+            pdf.close()
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("PDFParser: extracted %d pages from %s", len(documents), path)
+        return documents
+
+    def _parse_with_pypdf2(self, path: Path, documents: List[Document]) -> List[Document]:
+        """Extract page texts via PyPDF2 (pure-Python fallback).
+
+        Pages are independent and parts of extraction (zlib stream
+        decompression) release the GIL, so multi-page documents are
+        extracted with a small thread pool.  Documents are built in
+        index order afterwards so ``page_number`` stays deterministic.
+        """
         try:
             with path.open("rb") as fh:
                 reader = PyPDF2.PdfReader(fh)
-                num_pages = len(reader.pages)
-                for idx, page in enumerate(reader.pages):
-                    try:
-                        text = page.extract_text() or ""
-                    except Exception:
-                        logger.exception(
-                            "PDFParser: failed to extract text from page %d of %s",
-                            idx,
-                            file_path,
-                        )
-                        text = ""
+                pages = list(reader.pages)
+                num_pages = len(pages)
+                if num_pages > 1:
+                    with ThreadPoolExecutor(
+                        max_workers=min(8, num_pages)
+                    ) as executor:
+                        texts = list(executor.map(_safe_extract, pages))
+                else:
+                    texts = [_safe_extract(page) for page in pages]
+                for idx, text in enumerate(texts):
                     metadata = {
                         "file_path": str(path),
                         "page_number": idx + 1,
@@ -59,7 +129,8 @@ class PDFParser(DocumentParser):
                     }
                     documents.append(Document(text=text, metadata=metadata))
         except Exception:
-            logger.exception("PDFParser: failed to read PDF %s", file_path)
+            logger.exception("PDFParser: failed to read PDF %s", path)
             return documents
-        logger.debug("PDFParser: extracted %d pages from %s", len(documents), file_path)
-        return documents
\ No newline at end of file
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("PDFParser: extracted %d pages from %s", len(documents), path)
+        return documents
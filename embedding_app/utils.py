@@ -8,12 +8,16 @@ file hierarchies and configuring the Python logging subsystem.
 
 from __future__ import annotations
 
+import atexit
 import logging
+import logging.handlers
 import os
-import random
-import string
+import secrets
 from pathlib import Path
-from typing import Iterable, List, Tuple
+from typing import FrozenSet, Iterable, Iterator, List, Optional, Tuple
+
+
+logger = logging.getLogger(__name__)
 
 
 def setup_logging(log_dir: str, log_level: int = logging.INFO) -> None:
@@ -33,8 +37,9 @@ def setup_logging(log_dir: str, log_level: int = logging.INFO) -> None:
     handlers.  It should therefore be called once at application
     startup.
     """
-    Path(log_dir).mkdir(parents=True, exist_ok=True)
-    log_file = Path(log_dir) / "application.log"
+    log_dir_path = Path(log_dir)
+    log_dir_path.mkdir(parents=True, exist_ok=True)
+    log_file = log_dir_path / "application.log"
 
     # Remove any existing handlers to avoid duplicate log entries
     root_logger = logging.getLogger()
@@ -43,20 +48,28 @@ def setup_logging(log_dir: str, log_level: int = logging.INFO) -> None:
 
     root_logger.setLevel(log_level)
 
-    # File handler
+    # File handler.  A plain FileHandler flushes every record, costing
+    # one write syscall per log line; buffering through a MemoryHandler
+    # batches records 1024 at a time while still flushing immediately
+    # on ERROR so failures are never stuck in the buffer.  The atexit
+    # flush covers records logged after the last batch boundary.
     file_handler = logging.FileHandler(log_file, encoding="utf-8")
     file_formatter = logging.Formatter(
         fmt="%(asctime)s - %(levelname)s - %(name)s - %(message)s",
         datefmt="%Y-%m-%d %H:%M:%S",
     )
     file_handler.setFormatter(file_formatter)
+    buffered_handler = logging.handlers.MemoryHandler(
+        capacity=1024, flushLevel=logging.ERROR, target=file_handler
+    )
+    atexit.register(buffered_handler.flush)
 
     # Console handler
     console_handler = logging.StreamHandler()
     console_formatter = logging.Formatter("%(levelname)s: %(message)s")
     console_handler.setFormatter(console_formatter)
 
-    root_logger.addHandler(file_handler)
+    root_logger.addHandler(buffered_handler)
     root_logger.addHandler(console_handler)
 
 
@@ -71,10 +84,12 @@ def random_suffix(length: int = 4) -> str:
     Returns
     -------
     str
-        A random string composed of uppercase letters and digits.
+        A random string of uppercase hexadecimal characters.
     """
-    alphabet = string.ascii_uppercase + string.digits
-    return "".join(random.choices(alphabet, k=length))
+    # secrets.token_hex is one os.urandom call plus C-level hex
+    # formatting, versus one locked Mersenne-Twister draw and a list
+    # index per character with random.choices.
+    return secrets.token_hex((length + 1) // 2)[:length].upper()
 
 
 def ensure_unique_path(base_dir: str, desired_name: str) -> str:
@@ -98,34 +113,73 @@ def ensure_unique_path(base_dir: str, desired_name: str) -> str:
         A unique name that does not collide with existing files or
         directories inside ``base_dir``.
     """
-    base_path = Path(base_dir)
+    # One listdir snapshot turns each collision probe into a set
+    # lookup instead of a Path construction plus a stat syscall per
+    # attempt.  lexists semantics (a dangling symlink still counts as
+    # taken) come for free since listdir reports symlinks by name.
+    try:
+        existing = frozenset(os.listdir(base_dir))
+    except OSError:
+        # Base directory does not exist yet; any name is unique.
+        return desired_name
     candidate = desired_name
-    while (base_path / candidate).exists():
+    while candidate in existing:
         candidate = f"{desired_name}_{random_suffix()}"
     return candidate
 
 
-def list_files(directory: str) -> List[str]:
-    """Recursively list all files under a directory.
+def list_files(
+    directory: str, extensions: Optional[FrozenSet[str]] = None
+) -> Iterator[str]:
+    """Recursively yield all file paths under a directory.
 
-    Binary files are not filtered by this function; filtering based on
-    extension should be performed by callers via the parser factory.
+    The walk uses an explicit ``os.scandir`` stack: ``DirEntry``
+    objects carry cached type information so no extra ``stat`` is
+    issued per entry, and paths come straight from ``entry.path``
+    without per-file string joins.  Results are yielded lazily so
+    large trees never materialise in memory; wrap in ``list`` if a
+    list is needed.
 
     Parameters
     ----------
     directory:
         Path to the directory to search.
-
-    Returns
-    -------
-    list of str
-        Absolute paths to all files found.
+    extensions:
+        Optional set of lowercase dot-prefixed extensions (e.g.
+        ``frozenset({".txt", ".md"})``).  Filtering inside the walk
+        means rejected files never reach the caller at all; when
+        ``None`` every file is yielded and callers filter via the
+        parser factory as before.
+
+    Yields
+    ------
+    str
+        Paths to all files found.
     """
-    path_obj = Path(directory)
-    if not path_obj.is_dir():
+    if not os.path.isdir(directory):
         raise ValueError(f"{directory} is not a directory")
-    files: List[str] = []
-    for root, _, filenames in os.walk(path_obj):
-        for fname in filenames:
-            files.append(str(Path(root) / fname))
-    return files
\ No newline at end of file
+    return _scan_tree(directory, extensions)
+
+
+def _scan_tree(directory: str, extensions: Optional[FrozenSet[str]]) -> Iterator[str]:
+    stack = [directory]
+    while stack:
+        try:
+            it = os.scandir(stack.pop())
+        except OSError:
+            # Match os.walk's default tolerance: an unreadable
+            # subdirectory is skipped, not fatal to the whole walk.
+            logger.debug("list_files: cannot scan directory", exc_info=True)
+            continue
+        with it:
+            for entry in it:
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+                    continue
+                if extensions is not None:
+                    name = entry.name
+                    dot = name.rfind(".")
+                    ext = name[dot:].lower() if dot >= 0 else ""
+                    if ext not in extensions:
+                        continue
+                yield entry.path
\ No newline at end of file